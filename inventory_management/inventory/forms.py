@@ -1,9 +1,5 @@
 from django import forms
 from .models import Product
-from decimal import Decimal
-from django.test import TestCase
-from .models import Product
-from decimal import Decimal
 
 
 class ProductForm(forms.ModelForm):
@@ -11,14 +7,3 @@ class ProductForm(forms.ModelForm):
         model = Product
         fields = ["name", "description", "price", "quantity"]
 
-    def clean_quantity(self):
-        quantity = self.cleaned_data.get("quantity")
-        if quantity is not None and quantity < 0:
-            raise forms.ValidationError("Quantity cannot be negative.")
-        return quantity
-
-    def clean_price(self):
-        price = self.cleaned_data.get("price")
-        if price is not None and price < 0:
-            raise forms.ValidationError("Price cannot be negative.")
-        return price
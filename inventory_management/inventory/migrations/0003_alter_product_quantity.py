@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0002_alter_product_price_alter_product_quantity'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='quantity',
+            field=models.PositiveIntegerField(),
+        ),
+    ]
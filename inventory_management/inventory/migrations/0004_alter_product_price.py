@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:15
+
+import django.core.validators
+import inventory.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0003_alter_product_quantity'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='price',
+            field=inventory.models.NonNegativeDecimalField(decimal_places=2, max_digits=10, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+    ]
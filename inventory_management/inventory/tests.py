@@ -1,35 +1,35 @@
-from django.test import TestCase
+from django.test import RequestFactory, SimpleTestCase, TestCase
 from .models import Product
 from .forms import ProductForm
+from .views import product_create, product_delete, product_update
 from decimal import Decimal
-from .forms import ProductForm
 from django.urls import reverse
 from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
 
+# Shared Decimal values, parsed once per process
+_D0 = Decimal("0.00")
+_D1 = Decimal("1.00")
+_D5 = Decimal("5.00")
+_D10 = Decimal("10.00")
+_D999 = Decimal("9.99")
+_D12 = Decimal("12.00")
 
-class ProductModelTest(TestCase):
-
-    def setUp(self):
-        Product.objects.create(
-            name="Test Product",
-            description="A product for testing.",
-            price=9.99,
-            quantity=5,
-        )
 
+class ProductValidationTest(SimpleTestCase):
     def test_negative_quantity_model(self):
         product = Product(
             name="Negative Quantity",
             description="Should fail",
-            price=Decimal("1.00"),
+            price=_D1,
             quantity=-1,
         )
-        with self.assertRaises(Exception):
+        with self.assertRaises(ValidationError):
             product.full_clean()
 
     def test_str_method_empty_name(self):
         product = Product(
-            name="", description="No name", price=Decimal("1.00"), quantity=1
+            name="", description="No name", price=_D1, quantity=1
         )
         self.assertEqual(str(product), "")
 
@@ -43,114 +43,197 @@ class ProductModelTest(TestCase):
         with self.assertRaises(ValidationError):
             product.full_clean()
 
+    def test_missing_required_fields(self):
+        product = Product(description="Missing name", price=_D1, quantity=1)
+        with self.assertRaises(ValidationError):
+            product.full_clean()  # This will raise a ValidationError
+
+
+class ProductModelTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_product = Product.objects.create(
+            name="Test Product",
+            description="A product for testing.",
+            price=_D999,
+            quantity=5,
+        )
+
     def test_zero_price_and_quantity(self):
         product = Product.objects.create(
             name="Zero Product",
             description="Zero values",
-            price=Decimal("0.00"),
+            price=_D0,
             quantity=0,
         )
-        self.assertEqual(product.price, Decimal("0.00"))
+        self.assertEqual(product.price, _D0)
         self.assertEqual(product.quantity, 0)
 
     def test_max_length_name(self):
         name = "A" * 100  # max_length is 100
         product = Product.objects.create(
-            name=name, description="Max length name", price=Decimal("1.00"), quantity=1
+            name=name, description="Max length name", price=_D1, quantity=1
         )
         self.assertEqual(product.name, name)
 
-    def test_missing_required_fields(self):
-        product = Product(description="Missing name", price=Decimal("1.00"), quantity=1)
-        with self.assertRaises(Exception):
-            product.full_clean()  # This will raise a ValidationError
+    def test_negative_quantity_rejected_by_database(self):
+        # bulk_create skips full_clean, so the column type has to reject this
+        # (a CHECK on SQLite/PostgreSQL, UNSIGNED on strict-mode MySQL)
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            Product.objects.bulk_create(
+                [
+                    Product(
+                        name="Negative Quantity",
+                        description="Bypasses validation",
+                        price=_D1,
+                        quantity=-1,
+                    ),
+                ]
+            )
+
+    def test_negative_price_rejected_by_database(self):
+        # Column CHECK on price; MySQL only enforces it from 8.0.16
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            Product.objects.bulk_create(
+                [
+                    Product(
+                        name="Negative Price",
+                        description="Bypasses validation",
+                        price=Decimal("-1.00"),
+                        quantity=1,
+                    ),
+                ]
+            )
 
     def test_product_str(self):
-        product = Product.objects.get(name="Test Product")
-        self.assertEqual(str(product), "Test Product")
+        self.assertEqual(str(self.test_product), "Test Product")
 
     def test_product_fields(self):
-        product = Product.objects.get(name="Test Product")
+        product = self.test_product
         self.assertEqual(product.description, "A product for testing.")
-        self.assertEqual(product.price, Decimal("9.99"))  # Fix here
+        self.assertEqual(product.price, _D999)  # Fix here
         self.assertEqual(product.quantity, 5)
 
 
 class ProductViewTest(TestCase):
-    def setUp(self):
-        Product.objects.create(
+    # Mutation views are called directly; only the list view needs the
+    # full client for template assertions
+    rf = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        # Created on its own so the pk is set on every backend; bulk_create
+        # only returns pks where the database supports it (not MySQL)
+        cls.view_product = Product.objects.create(
             name="View Product",
             description="View test.",
-            price=Decimal("5.00"),
+            price=_D5,
             quantity=2,
         )
+        Product.objects.bulk_create(
+            [
+                Product(
+                    name="Second Product",
+                    description="Second view test.",
+                    price=Decimal("6.00"),
+                    quantity=3,
+                ),
+                Product(
+                    name="Third Product",
+                    description="Third view test.",
+                    price=Decimal("7.00"),
+                    quantity=4,
+                ),
+            ]
+        )
+        cls.url_list = reverse("product_list")
+        cls.url_create = reverse("product_create")
+        cls.url_update = reverse("product_update", args=[cls.view_product.pk])
+        cls.url_delete = reverse("product_delete", args=[cls.view_product.pk])
 
     def test_product_list_view(self):
-        response = self.client.get(reverse("product_list"))
+        # One query for the whole list, however many products there are
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url_list)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "View Product")
+        self.assertContains(response, "Third Product")
         self.assertTemplateUsed(response, "inventory/product_list.html")
 
     def test_product_create_view(self):
-        response = self.client.post(
-            reverse("product_create"),
-            {
-                "name": "Created Product",
-                "description": "Created via view.",
-                "price": "7.50",
-                "quantity": 3,
-            },
-        )
+        with self.assertNumQueries(1):  # INSERT
+            response = product_create(
+                self.rf.post(
+                    self.url_create,
+                    {
+                        "name": "Created Product",
+                        "description": "Created via view.",
+                        "price": "7.50",
+                        "quantity": 3,
+                    },
+                )
+            )
         self.assertEqual(response.status_code, 302)  # Redirect after creation
         self.assertTrue(Product.objects.filter(name="Created Product").exists())
         # Check redirect location
-        self.assertRedirects(response, reverse("product_list"))
+        self.assertEqual(response.url, self.url_list)
 
     def test_product_update_view(self):
-        product = Product.objects.get(name="View Product")
-        response = self.client.post(
-            reverse("product_update", args=[product.pk]),
-            {
-                "name": "Updated Product",
-                "description": "Updated description.",
-                "price": "10.00",
-                "quantity": 4,
-            },
-        )
+        product = self.view_product
+        with self.assertNumQueries(2):  # SELECT + UPDATE
+            response = product_update(
+                self.rf.post(
+                    self.url_update,
+                    {
+                        "name": "Updated Product",
+                        "description": "Updated description.",
+                        "price": "10.00",
+                        "quantity": 4,
+                    },
+                ),
+                pk=product.pk,
+            )
         self.assertEqual(response.status_code, 302)  # Redirect after update
         product.refresh_from_db()
         self.assertEqual(product.name, "Updated Product")
         self.assertEqual(product.description, "Updated description.")
-        self.assertEqual(product.price, Decimal("10.00"))
+        self.assertEqual(product.price, _D10)
         self.assertEqual(product.quantity, 4)
 
     def test_product_update_view2(self):
         product = Product.objects.create(
             name="Update Product",
             description="Update test.",
-            price=Decimal("10.00"),
+            price=_D10,
             quantity=1,
         )
-        response = self.client.post(
-            reverse("product_update", args=[product.pk]),
-            {
-                "name": "Updated Product",
-                "description": "Updated via view.",
-                "price": "12.00",
-                "quantity": 4,
-            },
+        response = product_update(
+            self.rf.post(
+                reverse("product_update", args=[product.pk]),
+                {
+                    "name": "Updated Product",
+                    "description": "Updated via view.",
+                    "price": "12.00",
+                    "quantity": 4,
+                },
+            ),
+            pk=product.pk,
         )
         self.assertEqual(response.status_code, 302)
         product.refresh_from_db()
         self.assertEqual(product.name, "Updated Product")
-        self.assertEqual(product.price, Decimal("12.00"))
+        self.assertEqual(product.price, _D12)
 
     def test_product_delete_view(self):
-        product = Product.objects.get(name="View Product")
-        response = self.client.post(reverse("product_delete", args=[product.pk]))
+        with self.assertNumQueries(2):  # SELECT + DELETE
+            response = product_delete(
+                self.rf.post(self.url_delete),
+                pk=self.view_product.pk,
+            )
         self.assertEqual(response.status_code, 302)  # Redirect after deletion
         self.assertFalse(Product.objects.filter(name="View Product").exists())
-        self.assertRedirects(response, reverse("product_list"))
+        self.assertEqual(response.url, self.url_list)
 
 
 class ProductFormTest(TestCase):
@@ -193,10 +276,10 @@ class ProductFormTest(TestCase):
             }
         )
         self.assertTrue(form.is_valid())
-        product = form.save()
+        product = form.save(commit=False)
         self.assertEqual(product.name, "Valid Product")
         self.assertEqual(product.description, "All fields valid.")
-        self.assertEqual(product.price, Decimal("10"))
+        self.assertEqual(product.price, _D10)
         self.assertEqual(product.quantity, 5)
 
     def test_zero_quantity(self):
@@ -209,7 +292,7 @@ class ProductFormTest(TestCase):
             }
         )
         self.assertTrue(form.is_valid())
-        product = form.save()
+        product = form.save(commit=False)
         self.assertEqual(product.quantity, 0)
 
     def test_zero_price(self):
@@ -222,8 +305,8 @@ class ProductFormTest(TestCase):
             }
         )
         self.assertTrue(form.is_valid())
-        product = form.save()
-        self.assertEqual(product.price, Decimal("0"))
+        product = form.save(commit=False)
+        self.assertEqual(product.price, _D0)
 
     def test_large_quantity(self):
         form = ProductForm(
@@ -235,7 +318,7 @@ class ProductFormTest(TestCase):
             }
         )
         self.assertTrue(form.is_valid())
-        product = form.save()
+        product = form.save(commit=False)
         self.assertEqual(product.quantity, 1000000)
 
     def test_large_price(self):
@@ -248,7 +331,7 @@ class ProductFormTest(TestCase):
             }
         )
         self.assertTrue(form.is_valid())
-        product = form.save()
+        product = form.save(commit=False)
         self.assertEqual(product.price, Decimal("9999999.99"))
 
     def test_whitespace_name(self):
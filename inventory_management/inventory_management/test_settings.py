@@ -0,0 +1,15 @@
+"""
+Test settings for inventory_management project.
+
+Runs the test suite against an in-memory SQLite database so that it needs
+no MySQL server and can be split across processes with --parallel.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}